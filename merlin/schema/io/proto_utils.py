@@ -16,7 +16,7 @@ from typing import TypeVar
 
 import betterproto
 from betterproto import Message as BetterProtoMessage
-from google.protobuf import json_format, text_format
+from google.protobuf import text_format
 from google.protobuf.message import Message as ProtoMessage
 
 ProtoMessageType = TypeVar("ProtoMessageType", bound=BetterProtoMessage)
@@ -42,9 +42,39 @@ def has_field(message: ProtoMessageType, field_name: str) -> bool:
     return betterproto.serialized_on_wire(getattr(message, field_name))
 
 
+def parse_into(better_proto_message: ProtoMessageType, json: str) -> ProtoMessageType:
+    """Parse a JSON string into an existing BetterProto message, reusing the instance
+
+    Resetting and reusing a message avoids re-allocating the message object
+    (and its nested field containers) when parsing many schemas in a loop.
+
+    Parameters
+    ----------
+    better_proto_message : ProtoMessageType
+        An existing BetterProto message object to parse into
+    json : str
+        The JSON string to parse
+
+    Returns
+    -------
+    ProtoMessageType
+        The same message object, populated from the JSON string
+
+    """
+    # BetterProto messages don't have a `Clear()` method, but re-running
+    # the dataclass initializer resets all fields to their defaults
+    better_proto_message.__init__()
+    return better_proto_message.from_json(json)
+
+
 def copy_better_proto_message(better_proto_message: ProtoMessageType, **kwargs) -> ProtoMessageType:
     """Create a copy of a Protobuf message
 
+    The copy is made with a single serialize/parse round trip through the
+    binary wire format, which is faster than recursively copying the message
+    tree at the python level. Keyword arguments are applied as field
+    overrides on the copy after parsing.
+
     Parameters
     ----------
     better_proto_message : ProtoMessageType
@@ -107,6 +137,7 @@ def proto_text_to_better_proto(
 
     """
     proto = text_format.Parse(proto_text, message)
-    json_str = json_format.MessageToJson(proto)
 
-    return better_proto_message.__class__().from_json(json_str)
+    # a binary serialize/parse round trip is much cheaper than translating
+    # the message through its JSON representation
+    return better_proto_message.__class__().parse(proto.SerializeToString())
@@ -12,15 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import functools
 import os
 import pathlib
+import threading
+import urllib.parse
 from typing import Union
 
 import fsspec
 import numpy
 
+try:
+    # orjson parses and serializes JSON several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 from merlin.schema.io import proto_utils, schema_bp
-from merlin.schema.io.schema_bp import Feature, FeatureType, FloatDomain, IntDomain
+from merlin.schema.io.schema_bp import Annotation, Feature, FeatureType, FloatDomain, IntDomain
 from merlin.schema.io.schema_bp import Schema as ProtoSchema
 from merlin.schema.io.schema_bp import ValueCount
 from merlin.schema.schema import ColumnSchema
@@ -34,6 +43,43 @@ FEATURE_TYPES = {
     "float": FeatureType.FLOAT,
 }
 
+# Fast path for the common dtypes, keyed on both the numpy scalar type and its
+# dtype so a single dict lookup replaces the `_dtype_name` probing
+_DTYPE_FEATURE_TYPES = {}
+for _kind in ("int", "uint", "float"):
+    for _scalar_type in numpy.sctypes[_kind]:
+        _DTYPE_FEATURE_TYPES[_scalar_type] = FEATURE_TYPES[_kind]
+        _DTYPE_FEATURE_TYPES[numpy.dtype(_scalar_type)] = FEATURE_TYPES[_kind]
+
+
+_SCHEMA_PB2_CLS = None
+_local = threading.local()
+
+
+def _get_schema_pb2_cls():
+    """Import `tensorflow_metadata`'s Schema class once and cache it"""
+    global _SCHEMA_PB2_CLS
+    if _SCHEMA_PB2_CLS is None:
+        from tensorflow_metadata.proto.v0 import schema_pb2
+
+        _SCHEMA_PB2_CLS = schema_pb2.Schema
+    return _SCHEMA_PB2_CLS
+
+
+def _scratch_schema_pb():
+    """Return a cleared thread-local `schema_pb2.Schema` scratch message
+
+    Constructing one of these performs descriptor-pool lookups and buffer
+    allocations on every call, so the proto-text conversions reuse a single
+    instance per thread instead.
+    """
+    scratch = getattr(_local, "schema_pb", None)
+    if scratch is None:
+        scratch = _local.schema_pb = _get_schema_pb2_cls()()
+    else:
+        scratch.Clear()
+    return scratch
+
 
 class TensorflowMetadata:
     """
@@ -42,6 +88,8 @@ class TensorflowMetadata:
     See https://github.com/tensorflow/metadata for details on this metadata serialization format
     """
 
+    __slots__ = ("proto_schema",)
+
     def __init__(self, schema: ProtoSchema = None):
         self.proto_schema = schema
 
@@ -60,7 +108,10 @@ class TensorflowMetadata:
             Schema object parsed from JSON
 
         """
-        schema = ProtoSchema().from_json(json)
+        if orjson:
+            schema = ProtoSchema().from_dict(orjson.loads(json))
+        else:
+            schema = ProtoSchema().from_json(json)
         return TensorflowMetadata(schema)
 
     @classmethod
@@ -78,7 +129,7 @@ class TensorflowMetadata:
             Schema object parsed from JSON file
 
         """
-        return cls.from_json(_read_file(path))
+        return cls.from_json(_read_file_bytes(path))
 
     @classmethod
     def from_proto_text(cls, proto_text: str) -> "TensorflowMetadata":
@@ -95,10 +146,8 @@ class TensorflowMetadata:
             Schema object parsed from Protobuf text
 
         """
-        from tensorflow_metadata.proto.v0 import schema_pb2
-
         schema = proto_utils.proto_text_to_better_proto(
-            ProtoSchema(), proto_text, schema_pb2.Schema()
+            ProtoSchema(), proto_text, _scratch_schema_pb()
         )
 
         return TensorflowMetadata(schema)
@@ -125,6 +174,71 @@ class TensorflowMetadata:
         path = pathlib.Path(path) / file_name
         return cls.from_proto_text(_read_file(path))
 
+    @classmethod
+    def from_proto_bytes(cls, proto_bytes: bytes) -> "TensorflowMetadata":
+        """Create a TensorflowMetadata schema object from binary Protobuf data
+
+        Binary Protobuf is much faster to parse than the text or JSON formats,
+        which both go through reflection-based conversions.
+
+        Parameters
+        ----------
+        proto_bytes : bytes
+            Serialized Protobuf data to parse
+
+        Returns
+        -------
+        TensorflowMetadata
+            Schema object parsed from binary Protobuf
+
+        """
+        schema = ProtoSchema().parse(proto_bytes)
+        return TensorflowMetadata(schema)
+
+    @classmethod
+    def from_proto_file(cls, path: os.PathLike, file_name="schema.pb") -> "TensorflowMetadata":
+        """Create a TensorflowMetadata schema object from a binary Protobuf file
+
+        Parameters
+        ----------
+        path : str
+            Path to the directory containing the binary Protobuf file to parse
+        file_name : str
+            Name of the schema file. Defaults to "schema.pb".
+
+        Returns
+        -------
+        TensorflowMetadata
+            Schema object parsed from binary Protobuf file
+
+        """
+        path = pathlib.Path(path) / file_name
+        return cls.from_proto_bytes(_read_file_bytes(path))
+
+    def to_proto_bytes(self) -> bytes:
+        """Convert this TensorflowMetadata schema object to binary Protobuf data
+
+        Returns
+        -------
+        bytes
+            Serialized Protobuf data
+
+        """
+        return bytes(self.proto_schema)
+
+    def to_proto_file(self, path: str, file_name="schema.pb"):
+        """Write this TensorflowMetadata schema object to a file as binary Protobuf data
+
+        Parameters
+        ----------
+        path : str
+            Path to the directory to write the binary Protobuf file to
+        file_name : str
+            Name of the output file. Defaults to "schema.pb".
+
+        """
+        _write_file(self.to_proto_bytes(), path, file_name)
+
     def to_proto_text(self) -> str:
         """Convert this TensorflowMetadata schema object to a Proto text string
 
@@ -134,9 +248,7 @@ class TensorflowMetadata:
             Generated Proto text string
 
         """
-        from tensorflow_metadata.proto.v0 import schema_pb2
-
-        return proto_utils.better_proto_to_proto_text(self.proto_schema, schema_pb2.Schema())
+        return proto_utils.better_proto_to_proto_text(self.proto_schema, _scratch_schema_pb())
 
     def to_proto_text_file(self, path: str, file_name="schema.pbtxt"):
         """Write this TensorflowMetadata schema object to a file as a Proto text string
@@ -179,10 +291,7 @@ class TensorflowMetadata:
             Schema converted to a TensorflowMetadata schema object
 
         """
-        features = []
-        for col_name, col_schema in schema.column_schemas.items():
-            features.append(_pb_feature(col_schema))
-
+        features = [_pb_feature(col_schema) for col_schema in schema.column_schemas.values()]
         proto_schema = ProtoSchema(feature=features)
 
         return TensorflowMetadata(proto_schema)
@@ -213,10 +322,12 @@ class TensorflowMetadata:
             Schema converted to a JSON string
 
         """
+        if orjson:
+            return orjson.dumps(self.proto_schema.to_dict()).decode("utf-8")
         return self.proto_schema.to_json()
 
 
-def _pb_int_domain(column_schema):
+def _pb_int_domain(column_schema, tag_values):
     domain = column_schema.properties.get("domain")
     if domain is None:
         return None
@@ -225,13 +336,11 @@ def _pb_int_domain(column_schema):
         name=domain.get("name", None),
         min=domain.get("min", None),
         max=domain.get("max", None),
-        is_categorical=(
-            Tags.CATEGORICAL in column_schema.tags or Tags.CATEGORICAL.value in column_schema.tags
-        ),
+        is_categorical=Tags.CATEGORICAL.value in tag_values,
     )
 
 
-def _pb_float_domain(column_schema):
+def _pb_float_domain(column_schema, tag_values):
     domain = column_schema.properties.get("domain")
     if domain is None:
         return None
@@ -242,18 +351,19 @@ def _pb_float_domain(column_schema):
     )
 
 
-def _dtype_name(column_schema):
+@functools.lru_cache(maxsize=128)
+def _dtype_name(dtype):
     # TODO: Decide if we need this since we've standardized on numpy types
-    if hasattr(column_schema.dtype, "kind"):
-        return numpy.core._dtype._kind_name(column_schema.dtype)
-    elif hasattr(column_schema.dtype, "item"):
-        return type(column_schema.dtype(1).item()).__name__
-    elif isinstance(column_schema.dtype, str):
-        return column_schema.dtype
-    elif hasattr(column_schema.dtype, "__name__"):
-        return column_schema.dtype.__name__
+    if hasattr(dtype, "kind"):
+        return numpy.core._dtype._kind_name(dtype)
+    elif hasattr(dtype, "item"):
+        return type(dtype(1).item()).__name__
+    elif isinstance(dtype, str):
+        return dtype
+    elif hasattr(dtype, "__name__"):
+        return dtype.__name__
     else:
-        raise TypeError(f"unsupported dtype for column schema: {column_schema.dtype}")
+        raise TypeError(f"unsupported dtype for column schema: {dtype}")
 
 
 def _pb_extra_metadata(column_schema):
@@ -267,38 +377,55 @@ def _pb_extra_metadata(column_schema):
 
 
 def _pb_tag(column_schema):
-    return [tag.value if hasattr(tag, "value") else tag for tag in column_schema.tags]
+    # isinstance is significantly cheaper than probing each tag with hasattr
+    return [tag.value if isinstance(tag, Tags) else tag for tag in column_schema.tags]
 
 
 def _pb_feature(column_schema):
     feature = Feature(name=column_schema.name)
 
-    feature = _set_feature_domain(feature, column_schema)
+    # normalize the tags once per feature and share the result between the
+    # domain constructors and the annotation
+    tag_values = _pb_tag(column_schema)
+
+    feature = _set_feature_domain(feature, column_schema, tag_values)
 
-    value_count = column_schema.properties.get("value_count", {})
+    value_count = column_schema.properties.get("value_count")
     if value_count:
         min_length = value_count.get("min", 0)
         max_length = value_count.get("max", 0)
         feature.value_count = ValueCount(min=min_length, max=max_length)
 
-    feature.annotation.tag = _pb_tag(column_schema)
-    feature.annotation.extra_metadata.append(_pb_extra_metadata(column_schema))
+    # building the annotation in one shot avoids re-running betterproto's
+    # lazy field initialization for each attribute touched on it
+    feature.annotation = Annotation(
+        tag=tag_values,
+        extra_metadata=[_pb_extra_metadata(column_schema)],
+    )
     return feature
 
 
-def _set_feature_domain(feature, column_schema):
-    DOMAIN_CONSTRUCTORS = {
-        FeatureType.INT: _pb_int_domain,
-        FeatureType.FLOAT: _pb_float_domain,
-    }
+# Domain attribute name and constructor per feature type, precomputed so
+# _set_feature_domain needs a single lookup per column
+_DOMAIN_TABLE = {
+    FeatureType.INT: ("int_domain", _pb_int_domain),
+    FeatureType.FLOAT: ("float_domain", _pb_float_domain),
+}
+
 
-    pb_type = FEATURE_TYPES.get(_dtype_name(column_schema))
+def _set_feature_domain(feature, column_schema, tag_values):
+    try:
+        pb_type = _DTYPE_FEATURE_TYPES.get(column_schema.dtype)
+    except TypeError:
+        pb_type = None
+
+    if pb_type is None:
+        pb_type = FEATURE_TYPES.get(_dtype_name(column_schema.dtype))
     if pb_type:
         feature.type = pb_type
 
-        domain_attr = DOMAIN_ATTRS[pb_type]
-        domain_fn = DOMAIN_CONSTRUCTORS[pb_type]
-        domain = domain_fn(column_schema)
+        domain_attr, domain_fn = _DOMAIN_TABLE[pb_type]
+        domain = domain_fn(column_schema, tag_values)
         if domain:
             setattr(feature, domain_attr, domain)
 
@@ -383,20 +510,18 @@ float_dtypes_map = {
 }
 
 
+# Item-size maps and fallback dtypes by feature type. The fallbacks are the
+# numpy dtype equivalents of the deprecated `numpy.int`/`numpy.float` aliases.
+_FEATURE_DTYPES = {
+    FeatureType.INT: (int_dtypes_map, numpy.dtype("int64")),
+    FeatureType.FLOAT: (float_dtypes_map, numpy.dtype("float64")),
+}
+
+
 def _merlin_dtype(feature, properties):
-    dtype = None
     item_size = int(properties.get("dtype_item_size", 0)) or None
-    if feature.type == FeatureType.INT:
-        if item_size and item_size in int_dtypes_map:
-            dtype = int_dtypes_map[item_size]
-        else:
-            dtype = numpy.int
-    elif feature.type == FeatureType.FLOAT:
-        if item_size and item_size in float_dtypes_map:
-            dtype = float_dtypes_map[item_size]
-        else:
-            dtype = numpy.float
-    return dtype
+    sized_dtypes, fallback_dtype = _FEATURE_DTYPES.get(feature.type, ({}, None))
+    return sized_dtypes.get(item_size, fallback_dtype)
 
 
 def _merlin_column(feature):
@@ -417,11 +542,17 @@ def _merlin_column(feature):
     return ColumnSchema(name, tags, properties, dtype, is_list, is_ragged=is_ragged)
 
 
-def _read_file(path: os.PathLike):
+def _read_file(path: os.PathLike) -> str:
+    return _read_file_bytes(path).decode("utf-8")
+
+
+def _read_file_bytes(path: os.PathLike) -> bytes:
     # TODO: Should we be using fsspec here too?
     path = pathlib.Path(path)
     if path.is_file():
-        with open(path, "r") as f:
+        # read as raw bytes with a large buffer; decoding (when needed at all)
+        # is cheaper in one pass than through an incremental text wrapper
+        with open(path, "rb", buffering=1 << 20) as f:
             contents = f.read()
     else:
         raise ValueError("Path is not file")
@@ -429,12 +560,25 @@ def _read_file(path: os.PathLike):
     return contents
 
 
-def _write_file(contents: str, path: str, filename: str):
-    fs = fsspec.get_fs_token_paths(path)[0]
+@functools.lru_cache(maxsize=16)
+def _filesystem_for(url_prefix: str):
+    # re-parsing the URL and reconstructing the filesystem on every write is
+    # expensive for remote stores, so cache the filesystem per URL prefix
+    return fsspec.get_fs_token_paths(url_prefix)[0]
+
+
+def _write_file(contents: Union[str, bytes], path: str, filename: str):
+    parsed = urllib.parse.urlparse(str(path))
+    url_prefix = f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme else "file://"
+    fs = _filesystem_for(url_prefix)
+
+    if not isinstance(contents, bytes):
+        contents = contents.encode("utf-8")
 
     try:
-        with fs.open(fs.sep.join([str(path), filename]), "w") as f:
-            f.write(contents)
+        # pipe_file writes in a single call, which is one PUT on object stores
+        # instead of an open/write/close sequence
+        fs.pipe_file(fs.sep.join([str(path), filename]), contents)
     except Exception as e:
         if not fs.isdir(path):
             raise ValueError(f"The path provided is not a valid directory: {path}") from e
@@ -57,5 +57,10 @@ setup(
     zip_safe=False,
     python_requires=">=3.8",
     install_requires=install_reqs,
+    extras_require={
+        # protobuf>=4 wheels ship the native "upb" backend, which is much
+        # faster than the pure-python implementation for schema serialization
+        "protobuf-native": ["protobuf>=4.0.0"],
+    },
     cmdclass=versioneer.get_cmdclass(),
 )
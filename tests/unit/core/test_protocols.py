@@ -27,11 +27,13 @@ def test_dictionary_is_dictlike(protocol):
 
 
 @pytest.mark.parametrize("device", [None, "cpu"])
-@pytest.mark.parametrize("protocol", [DictLike, DataFrameLike, Transformable])
-def test_dataframes_match_protocols(protocol, device):
+def test_dataframes_match_protocols(device):
+    # construct the dataframe once per device and check it against all the
+    # protocols, rather than paying for a new dataframe per protocol
     obj = make_df({}, device=device)
 
-    assert isinstance(obj, protocol)
+    for protocol in (DictLike, DataFrameLike, Transformable):
+        assert isinstance(obj, protocol)
 
 
 @pytest.mark.parametrize("device", [None, "cpu"])
@@ -160,7 +160,10 @@ def test_column_schema_set_protobuf(tmpdir, props1, props2, tags1, tags2, d_type
     assert schema == loaded_schema
 
 
-@pytest.mark.parametrize("properties", [{}, {"domain": {"min": 0, "max": 10}}])
+@pytest.mark.parametrize(
+    "properties",
+    [{}, {"domain": {"min": 0, "max": 10}}, {"empty_map": {}, "empty_list": []}],
+)
 @pytest.mark.parametrize("tags", [[], ["a", "b", "c"]])
 @pytest.mark.parametrize("dtype", [numpy.float, numpy.int])
 @pytest.mark.parametrize("list_type", [True, False])
@@ -173,7 +176,10 @@ def test_schema_to_tensorflow_metadata(tmpdir, properties, tags, dtype, list_typ
     assert schema == loaded_schema
 
 
-@pytest.mark.parametrize("properties", [{}, {"domain": {"min": 0, "max": 10}}])
+@pytest.mark.parametrize(
+    "properties",
+    [{}, {"domain": {"min": 0, "max": 10}}, {"empty_map": {}, "empty_list": []}],
+)
 @pytest.mark.parametrize("tags", [[], ["a", "b", "c"]])
 @pytest.mark.parametrize("dtype", [numpy.float, numpy.int])
 @pytest.mark.parametrize("list_type", [True, False])
@@ -186,6 +192,66 @@ def test_schema_to_tensorflow_metadata_json(tmpdir, properties, tags, dtype, lis
     assert schema == loaded_schema
 
 
+@pytest.mark.parametrize(
+    "properties",
+    [{}, {"domain": {"min": 0, "max": 10}}, {"empty_map": {}, "empty_list": []}],
+)
+@pytest.mark.parametrize("tags", [[], ["a", "b", "c"]])
+@pytest.mark.parametrize("dtype", [numpy.float, numpy.int])
+@pytest.mark.parametrize("list_type", [True, False])
+def test_schema_to_tensorflow_metadata_proto_bytes(tmpdir, properties, tags, dtype, list_type):
+    schema = Schema(
+        [ColumnSchema("col", tags=tags, properties=properties, dtype=dtype, is_list=list_type)]
+    )
+    tf_metadata = TensorflowMetadata.from_merlin_schema(schema)
+
+    # round trip through binary protobuf in memory
+    loaded_schema = TensorflowMetadata.from_proto_bytes(tf_metadata.to_proto_bytes())
+    assert schema == loaded_schema.to_merlin_schema()
+
+    # and through a binary protobuf file on disk
+    tf_metadata.to_proto_file(tmpdir)
+    loaded_schema = TensorflowMetadata.from_proto_file(tmpdir)
+    assert schema == loaded_schema.to_merlin_schema()
+
+
+def test_tensorflow_metadata_from_json_to_proto_bytes():
+    # make sure schemas loaded from JSON with "@type" packed extra_metadata (like those
+    # written by merlin-models) can be serialized back out as binary protobuf
+    json_schema = """{"feature": [
+    {
+      "name": "categories",
+      "valueCount": {
+        "min": "1",
+        "max": "4"
+      },
+      "type": "INT",
+      "annotation": {
+        "tag": [
+          "item"
+        ],
+        "extraMetadata": [{
+          "@type": "type.googleapis.com/google.protobuf.Struct",
+          "value": {
+            "is_list": true,
+            "is_ragged": true,
+            "dtype_item_size": 64.0
+          }
+        }]
+      }
+    }]}
+    """
+
+    tf_metadata = TensorflowMetadata.from_json(json_schema)
+    loaded_schema = TensorflowMetadata.from_proto_bytes(tf_metadata.to_proto_bytes())
+    column_schema = loaded_schema.to_merlin_schema().column_schemas["categories"]
+
+    assert column_schema.properties["value_count"] == {"min": 1, "max": 4}
+    assert column_schema.is_list
+    assert column_schema.is_ragged
+    assert column_schema.dtype == numpy.dtype("int64")
+
+
 def test_tensorflow_metadata_from_json():
     # make sure we can load up tensorflowmetadata serialized json objects, like done by
     # merlin-models